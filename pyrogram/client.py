@@ -45,7 +45,7 @@ from pyrogram.errors import CDNFileHashMismatch
 from pyrogram.errors import (
     SessionPasswordNeeded,
     VolumeLocNotFound, ChannelPrivate,
-    BadRequest
+    BadRequest, FloodWait, InternalServerError, ServiceUnavailable
 )
 from pyrogram.handlers.handler import Handler
 from pyrogram.methods import Methods
@@ -215,6 +215,10 @@ class Client(Methods):
 
     MAX_CONCURRENT_TRANSMISSIONS = 1
 
+    # Time window in seconds (and maximum amount of queries) in which concurrent reactions are sent together
+    REACTION_BATCH_WINDOW = 0.005
+    REACTION_BATCH_SIZE = 100
+
     mimetypes = MimeTypes()
     mimetypes.readfp(StringIO(mime_types))
 
@@ -326,6 +330,9 @@ class Client(Methods):
 
         self.message_cache = Cache(10000)
 
+        # Resolved peer ids, so that resolve_peer doesn't need to hit the storage every time the same chat is used.
+        self.peer_cache = Cache(10000)
+
         # Sometimes, for some reason, the server will stop sending updates and will only respond to pings.
         # This watchdog will invoke updates.GetState in order to wake up the server and enable it sending updates again
         # after some idle time has been detected.
@@ -335,6 +342,12 @@ class Client(Methods):
         self.listeners = {listener_type: [] for listener_type in pyrogram.enums.ListenerTypes}
         self.loop = asyncio.get_event_loop()
 
+        # Reactions are usually sent in bursts. Instead of paying a full round-trip for each of them, concurrent
+        # reactions are queued and sent together inside a single MsgContainer.
+        self.reaction_batcher_task = None
+        self.reaction_queue = asyncio.Queue()
+        self.reaction_tasks = set()
+
     def __enter__(self):
         return self.start()
 
@@ -365,6 +378,97 @@ class Client(Methods):
             if datetime.now() - self.last_update_time > timedelta(seconds=self.UPDATES_WATCHDOG_INTERVAL):
                 await self.invoke(raw.functions.updates.GetState())
 
+    async def _reaction_batcher(self):
+        while True:
+            batch = [await self.reaction_queue.get()]
+
+            try:
+                await asyncio.sleep(self.REACTION_BATCH_WINDOW)
+            except asyncio.CancelledError:
+                self._fail_reaction_batch(batch)
+                raise
+
+            while not self.reaction_queue.empty() and len(batch) < self.REACTION_BATCH_SIZE:
+                batch.append(self.reaction_queue.get_nowait())
+
+            task = self.loop.create_task(self._send_reaction_batch(batch))
+            self.reaction_tasks.add(task)
+            task.add_done_callback(self.reaction_tasks.discard)
+
+    async def _send_reaction_batch(self, batch: List[tuple]):
+        try:
+            results = await self._invoke_reaction_batch([query for query, _ in batch])
+        except asyncio.CancelledError:
+            self._fail_reaction_batch(batch)
+            raise
+
+        for (_, future), r in zip(batch, results):
+            if future.done():
+                continue
+
+            if isinstance(r, Exception):
+                future.set_exception(r)
+            else:
+                future.set_result(r)
+
+    async def _invoke_reaction_batch(self, queries: List["raw.core.TLObject"]) -> list:
+        if len(queries) == 1:
+            return [await self._invoke_reaction_query(queries[0])]
+
+        wrapped_queries = queries
+
+        if self.no_updates:
+            wrapped_queries = [raw.functions.InvokeWithoutUpdates(query=query) for query in wrapped_queries]
+
+        if self.takeout_id:
+            wrapped_queries = [
+                raw.functions.InvokeWithTakeout(takeout_id=self.takeout_id, query=query)
+                for query in wrapped_queries
+            ]
+
+        try:
+            results = await self.session.send_container(wrapped_queries)
+        except Exception as e:
+            results = [e] * len(queries)
+
+        for i, query in enumerate(queries):
+            # Let invoke() deal with the errors it knows how to recover from (flood waits and retries)
+            if isinstance(results[i], (OSError, FloodWait, InternalServerError, ServiceUnavailable)):
+                results[i] = await self._invoke_reaction_query(query)
+            elif not isinstance(results[i], Exception):
+                try:
+                    await self.fetch_peers(getattr(results[i], "users", []))
+                    await self.fetch_peers(getattr(results[i], "chats", []))
+                except Exception as e:
+                    results[i] = e
+
+        return results
+
+    @staticmethod
+    def _fail_reaction_batch(batch: List[tuple]):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(ConnectionError("Client has been disconnected"))
+
+    async def _invoke_reaction_query(self, query):
+        try:
+            return await self.invoke(query)
+        except Exception as e:
+            return e
+
+    async def _invoke_batched_reaction(self, query):
+        """Invoke a reaction query, batching it together with other concurrent reactions."""
+        if not self.is_connected:
+            raise ConnectionError("Client has not been started yet")
+
+        if self.reaction_batcher_task is None:
+            self.reaction_batcher_task = self.loop.create_task(self._reaction_batcher())
+
+        future = self.loop.create_future()
+        self.reaction_queue.put_nowait((query, future))
+
+        return await future
+
     async def authorize(self) -> User:
         if self.bot_token:
             return await self.sign_in_bot(self.bot_token)
@@ -572,6 +676,14 @@ class Client(Methods):
 
             parsed_peers.append((peer_id, access_hash, peer_type, username, phone_number))
 
+            cached_peer = self.peer_cache[peer_id]
+
+            if cached_peer is not None and (
+                isinstance(peer, (raw.types.ChatForbidden, raw.types.ChannelForbidden))
+                or getattr(cached_peer, "access_hash", 0) != access_hash
+            ):
+                self.peer_cache.pop(peer_id)
+
         await self.storage.update_peers(parsed_peers)
         await self.storage.update_usernames(usernames)
 
@@ -1096,3 +1208,9 @@ class Cache:
         if len(self.store) > self.capacity:
             for _ in range(self.capacity // 2 + 1):
                 del self.store[next(iter(self.store))]
+
+    def pop(self, key):
+        return self.store.pop(key, None)
+
+    def clear(self):
+        self.store.clear()
@@ -59,8 +59,13 @@ class ResolvePeer:
         if not self.is_connected:
             raise ConnectionError("Client has not been started yet")
 
+        peer = self.peer_cache[peer_id]
+
+        if peer is not None:
+            return peer
+
         try:
-            return await self.storage.get_peer_by_id(peer_id)
+            peer = await self.storage.get_peer_by_id(peer_id)
         except KeyError:
             if isinstance(peer_id, str):
                 if peer_id in ("self", "me"):
@@ -122,6 +127,12 @@ class ResolvePeer:
                 )
 
             try:
-                return await self.storage.get_peer_by_id(peer_id)
+                peer = await self.storage.get_peer_by_id(peer_id)
             except KeyError:
                 raise PeerIdInvalid
+
+        # Numeric strings can resolve too, but fetch_peers only invalidates int keys
+        if isinstance(peer_id, int):
+            self.peer_cache[peer_id] = peer
+
+        return peer
@@ -17,6 +17,8 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
+
 import pyrogram
 
 
@@ -36,6 +38,23 @@ class Disconnect:
         if self.is_initialized:
             raise ConnectionError("Can't disconnect an initialized client")
 
+        # Stop batching reactions and fail every reaction still waiting to be sent or answered
+        reaction_tasks = list(self.reaction_tasks)
+
+        if self.reaction_batcher_task is not None:
+            reaction_tasks.append(self.reaction_batcher_task)
+            self.reaction_batcher_task = None
+
+        for task in reaction_tasks:
+            task.cancel()
+
+        await asyncio.gather(*reaction_tasks, return_exceptions=True)
+
+        while not self.reaction_queue.empty():
+            self._fail_reaction_batch([self.reaction_queue.get_nowait()])
+
+        self.peer_cache.clear()
+
         await self.session.stop()
         await self.storage.close()
         self.is_connected = False
@@ -17,12 +17,62 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with PyroFork.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Union, List
+from functools import lru_cache
+from typing import Union, List, Optional
 
 import pyrogram
 from pyrogram import raw, types
 
 
+# Raw reactions are only read when serialized, so the same object can be shared by every call reacting with it
+@lru_cache(maxsize=1024)
+def get_reaction(emoji: Union[int, str]) -> "raw.base.Reaction":
+    if isinstance(emoji, int):
+        return raw.types.ReactionCustomEmoji(document_id=emoji)
+
+    return raw.types.ReactionEmoji(emoticon=emoji)
+
+
+# Stories always need a reaction, retracting one means sending ReactionEmpty
+REACTION_EMPTY = raw.types.ReactionEmpty()
+
+
+def build_reaction(emoji: Union[int, str, "types.ReactionType"]) -> "raw.base.Reaction":
+    if not isinstance(emoji, types.ReactionType):
+        return get_reaction(emoji)
+
+    reaction = emoji.write()
+
+    if reaction is not None:
+        return reaction
+
+    # ReactionType(emoji=...) leaves the type unset, infer it from the field that was given
+    if emoji.emoji is not None:
+        return get_reaction(emoji.emoji)
+
+    if emoji.custom_emoji_id is not None:
+        return get_reaction(int(emoji.custom_emoji_id))
+
+    raise ValueError("ReactionType needs either an emoji or a custom_emoji_id")
+
+
+# Exact type lookups, anything else (e.g. subclasses) goes through build_reaction
+REACTION_BUILDERS = {
+    int: get_reaction,
+    str: get_reaction,
+    types.ReactionType: build_reaction
+}
+
+
+def get_reactions(
+    emoji: Union[int, str, "types.ReactionType", List[Union[int, str, "types.ReactionType"]]]
+) -> Optional[List["raw.base.Reaction"]]:
+    if not isinstance(emoji, list):
+        emoji = [emoji] if emoji else []
+
+    return [REACTION_BUILDERS.get(type(i), build_reaction)(i) for i in emoji] or None
+
+
 class SendReaction:
     async def send_reaction(
         self: "pyrogram.Client",
@@ -31,7 +81,8 @@ class SendReaction:
         story_id: int = None,
         emoji: Union[int, str, List[Union[int, str]]] = None,
         big: bool = False,
-        add_to_recent: bool = False
+        add_to_recent: bool = False,
+        reaction: Union["types.ReactionType", List["types.ReactionType"]] = None
     ) -> "types.MessageReactions":
         """Use this method to send reactions on a message/stories.
         Service messages can't be reacted to.
@@ -51,6 +102,7 @@ class SendReaction:
 
             story_id (``int``, *optional*):
                 Identifier of the story.
+                Only the first reaction is sent for stories.
 
             emoji (``int`` | ``str`` | List of ``int`` | ``str``, *optional*):
                 Reaction emoji.
@@ -66,6 +118,10 @@ class SendReaction:
                 Pass True if the reaction should appear in the recently used reactions.
                 This option is applicable only for users.
 
+            reaction (:obj:`~pyrogram.types.ReactionType` | List of :obj:`~pyrogram.types.ReactionType`, *optional*):
+                Reaction type, can be passed instead of *emoji*.
+                *emoji* is ignored when this is given.
+
         Returns:
             :obj:`~pyrogram.types.MessageReactions`: On success, True is returned.
 
@@ -83,20 +139,10 @@ class SendReaction:
                 await app.send_reaction(chat_id, message_id=message_id)
                 await app.send_reaction(chat_id, story_id=story_id)
         """
-        if isinstance(emoji, list):
-            reaction = [
-                    raw.types.ReactionCustomEmoji(document_id=i)
-                    if isinstance(i, int)
-                    else raw.types.ReactionEmoji(emoticon=i)
-                    for i in emoji
-            ] if emoji else None
-        else:
-            if isinstance(emoji, int):
-                reaction = [raw.types.ReactionCustomEmoji(document_id=emoji)]
-            else:
-                reaction = [raw.types.ReactionEmoji(emoticon=emoji)] if emoji else None
+        reaction = get_reactions(reaction if reaction is not None else emoji)
+
         if message_id is not None:
-            r = await self.invoke(
+            r = await self._invoke_batched_reaction(
                 raw.functions.messages.SendReaction(
                     peer=await self.resolve_peer(chat_id),
                     msg_id=message_id,
@@ -105,15 +151,18 @@ class SendReaction:
                     add_to_recent=add_to_recent
                 )
             )
-            for i in r.updates:
-              if isinstance(i, raw.types.UpdateMessageReactions):
-                  return types.MessageReactions._parse(self, i.reactions)
+            update = {type(i): i for i in r.updates}.get(raw.types.UpdateMessageReactions)
+
+            if update is None:
+                return None
+
+            return types.MessageReactions._parse(self, update.reactions)
         elif story_id is not None:
-            await self.invoke(
+            await self._invoke_batched_reaction(
                 raw.functions.stories.SendReaction(
                     peer=await self.resolve_peer(chat_id),
                     story_id=story_id,
-                    reaction=raw.types.ReactionEmoji(emoticon=emoji) if emoji else None,
+                    reaction=reaction[0] if reaction else REACTION_EMPTY,
                     add_to_recent=add_to_recent
                 )
             )
@@ -52,3 +52,8 @@ class MsgContainer(TLObject):
             b.write(message.write())
 
         return b.getvalue()
+
+    def __len__(self) -> int:
+        # Constructor ID and count, followed by each message: msg_id (8), seq_no (4), length (4) and body.
+        # Computed from the known body lengths, so that the messages don't need to be serialized again.
+        return 8 + sum(16 + message.length for message in self.messages)
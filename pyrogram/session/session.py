@@ -23,6 +23,7 @@ import logging
 import os
 from hashlib import sha1
 from io import BytesIO
+from typing import List
 
 import pyrogram
 from pyrogram import raw
@@ -374,6 +375,114 @@ class Session:
 
             return result
 
+    async def send_container(self, queries: List[TLObject], timeout: float = WAIT_TIMEOUT, retry: int = 0) -> list:
+        """Send several queries at once, packed in a single MsgContainer.
+
+        Returns a list with one item per query, in the same order: either the query result or the exception the
+        query raised.
+        """
+        try:
+            await asyncio.wait_for(self.is_started.wait(), self.WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+
+        errors = {}
+        messages = {}
+
+        for index, query in enumerate(queries):
+            # Serialize each query before it takes a msg_id and seq_no, so one that can't be written only fails itself
+            try:
+                len(query)
+            except Exception as e:
+                errors[index] = e
+            else:
+                messages[index] = self.msg_factory(query)
+
+        if not messages:
+            return [errors[index] for index in range(len(queries))]
+
+        container = self.msg_factory(MsgContainer(list(messages.values())))
+
+        for message in messages.values():
+            self.results[message.msg_id] = Result()
+
+        # Salt and msg_id notifications refer to the container itself rather than to the inner messages
+        self.results[container.msg_id] = Result()
+
+        log.debug("Sent: %s", container)
+
+        payload = await self.loop.run_in_executor(
+            pyrogram.crypto_executor,
+            mtproto.pack,
+            container,
+            self.salt,
+            self.session_id,
+            self.auth_key,
+            self.auth_key_id
+        )
+
+        try:
+            await self.connection.send(payload)
+        except OSError as e:
+            for message in messages.values():
+                self.results.pop(message.msg_id, None)
+
+            self.results.pop(container.msg_id, None)
+            raise e
+
+        responses = asyncio.gather(*[self.results[message.msg_id].event.wait() for message in messages.values()])
+        notification = self.loop.create_task(self.results[container.msg_id].event.wait())
+
+        await asyncio.wait([responses, notification], timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+        responses.cancel()
+        notification.cancel()
+
+        notification = self.results.pop(container.msg_id).value
+        values = {index: self.results.pop(message.msg_id).value for index, message in messages.items()}
+
+        if isinstance(notification, raw.types.BadMsgNotification):
+            if retry > 1:
+                raise BadMsgNotification(notification.error_code)
+
+            self._handle_bad_notification()
+            return await self.send_container(queries, timeout, retry + 1)
+
+        if isinstance(notification, raw.types.BadServerSalt):
+            self.salt = notification.new_server_salt
+            return await self.send_container(queries, timeout, retry)
+
+        results = []
+
+        for index, query in enumerate(queries):
+            if index in errors:
+                results.append(errors[index])
+                continue
+
+            value = values[index]
+
+            try:
+                if value is None:
+                    raise TimeoutError("Request timed out")
+
+                if isinstance(value, raw.types.RpcError):
+                    if isinstance(query, (raw.functions.InvokeWithoutUpdates, raw.functions.InvokeWithTakeout)):
+                        query = query.query
+
+                    RPCError.raise_it(value, type(query))
+
+                if isinstance(value, (raw.types.BadMsgNotification, raw.types.BadServerSalt)):
+                    if isinstance(value, raw.types.BadServerSalt):
+                        self.salt = value.new_server_salt
+
+                    value = await self.send(query, timeout=timeout)
+            except Exception as e:
+                value = e
+
+            results.append(value)
+
+        return results
+
     def _handle_bad_notification(self):
         new_msg_id = MsgId()
         if self.stored_msg_ids[len(self.stored_msg_ids)-1] >= new_msg_id:
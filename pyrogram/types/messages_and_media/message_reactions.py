@@ -53,7 +53,7 @@ class MessageReactions(Object):
         return MessageReactions(
             client=client,
             reactions=[
-                types.Reaction._parse_count(client, reaction)
+                types.Reaction._parse_fast(client, reaction.reaction, reaction.count, reaction.chosen_order)
                 for reaction in message_reactions.results
             ]
         )
@@ -23,6 +23,9 @@ import pyrogram
 from pyrogram import raw
 from ..object import Object
 
+# Raw reactions that can be represented by a Reaction (e.g. ReactionEmpty can't)
+PARSABLE_REACTIONS = {raw.types.ReactionEmoji, raw.types.ReactionCustomEmoji}
+
 
 class Reaction(Object):
     """Contains information about a reaction.
@@ -62,26 +65,35 @@ class Reaction(Object):
     def _parse(
         client: "pyrogram.Client",
         reaction: "raw.base.Reaction"
-    ) -> "Reaction":
-        if isinstance(reaction, raw.types.ReactionEmoji):
-            return Reaction(
-                client=client,
-                emoji=reaction.emoticon
-            )
-
-        if isinstance(reaction, raw.types.ReactionCustomEmoji):
-            return Reaction(
-                client=client,
-                custom_emoji_id=reaction.document_id
-            )
+    ) -> Optional["Reaction"]:
+        if type(reaction) in PARSABLE_REACTIONS:
+            return Reaction._parse_fast(client, reaction)
 
     @staticmethod
     def _parse_count(
         client: "pyrogram.Client",
         reaction_count: "raw.base.ReactionCount"
     ) -> "Reaction":
-        reaction = Reaction._parse(client, reaction_count.reaction)
-        reaction.count = reaction_count.count
-        reaction.chosen_order = reaction_count.chosen_order
+        return Reaction._parse_fast(
+            client,
+            reaction_count.reaction,
+            reaction_count.count,
+            reaction_count.chosen_order
+        )
+
+    @staticmethod
+    def _parse_fast(
+        client: "pyrogram.Client",
+        reaction: "raw.base.Reaction",
+        count: Optional[int] = None,
+        chosen_order: Optional[int] = None
+    ) -> "Reaction":
+        # Skip __init__ and set the attributes directly, one of these is parsed for each reaction of every message
+        parsed = object.__new__(Reaction)
+        parsed._client = client
+        parsed.emoji = getattr(reaction, "emoticon", None)
+        parsed.custom_emoji_id = getattr(reaction, "document_id", None)
+        parsed.count = count
+        parsed.chosen_order = chosen_order
 
-        return reaction
+        return parsed
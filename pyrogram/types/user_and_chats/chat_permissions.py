@@ -20,6 +20,45 @@
 from pyrogram import raw
 from ..object import Object
 
+# Rights toggled together when all_perms is set
+ALL_PERMS_RIGHTS = (
+    "send_messages", "send_media", "send_polls", "embed_links", "change_info",
+    "invite_users", "pin_messages", "manage_topics", "send_inline"
+)
+
+# ChatBannedRights arguments for all_perms=True and all_perms=False
+ALL_PERMS_BANNED_RIGHTS = {
+    all_perms: dict.fromkeys(ALL_PERMS_RIGHTS, not all_perms)
+    for all_perms in (True, False)
+}
+
+# Rights implied by can_send_media_messages
+MEDIA_RIGHTS = (
+    "embed_links", "send_audios", "send_docs", "send_games", "send_gifs", "send_inline",
+    "send_photos", "send_polls", "send_roundvideos", "send_stickers", "send_videos", "send_voices"
+)
+
+# ChatBannedRights flags paired with the permission they deny
+BANNED_RIGHTS = (
+    ("embed_links", "can_add_web_page_previews"),
+    ("send_polls", "can_send_polls"),
+    ("change_info", "can_change_info"),
+    ("invite_users", "can_invite_users"),
+    ("pin_messages", "can_pin_messages"),
+    ("manage_topics", "can_manage_topics"),
+    ("send_audios", "can_send_audios"),
+    ("send_docs", "can_send_docs"),
+    ("send_games", "can_send_games"),
+    ("send_gifs", "can_send_gifs"),
+    ("send_inline", "can_send_inline"),
+    ("send_photos", "can_send_photos"),
+    ("send_plain", "can_send_plain"),
+    ("send_roundvideos", "can_send_roundvideos"),
+    ("send_stickers", "can_send_stickers"),
+    ("send_videos", "can_send_videos"),
+    ("send_voices", "can_send_voices")
+)
+
 
 class ChatPermissions(Object):
     """Describes actions that a non-administrator user is allowed to take in a chat.
@@ -232,3 +271,57 @@ class ChatPermissions(Object):
                 can_send_videos=not denied_permissions.send_videos,
                 can_send_voices=not denied_permissions.send_voices
             )
+
+    @property
+    def _needs_old_permissions(self) -> bool:
+        # Whether write() has to fall back to the current chat permissions for some of the rights
+        if self.all_perms is not None:
+            return False
+
+        if self.can_send_messages is not None and self.can_send_media_messages is None:
+            return True
+
+        overridden = MEDIA_RIGHTS if self.can_send_media_messages is not None else ()
+
+        for right, permission in BANNED_RIGHTS:
+            if right in overridden or (right == "send_plain" and self.can_send_messages is not None):
+                continue
+
+            if getattr(self, permission) is None:
+                return True
+
+        return False
+
+    def write(
+        self,
+        old_permissions: "ChatPermissions" = None,
+        until_date: int = 0
+    ) -> "raw.types.ChatBannedRights":
+        if self.all_perms is not None:
+            return raw.types.ChatBannedRights(
+                until_date=until_date,
+                **ALL_PERMS_BANNED_RIGHTS[bool(self.all_perms)]
+            )
+
+        rights = {}
+
+        can_send_media_messages = self.can_send_media_messages
+
+        if self.can_send_messages is not None:
+            rights["send_plain"] = not self.can_send_messages
+
+            if can_send_media_messages is None:
+                can_send_media_messages = old_permissions.can_send_media_messages
+
+        if can_send_media_messages is not None:
+            rights.update(dict.fromkeys(MEDIA_RIGHTS, not can_send_media_messages))
+
+        # Old permissions are only read for the rights that are neither set nor implied
+        for right, permission in BANNED_RIGHTS:
+            if right in rights:
+                continue
+
+            value = getattr(self, permission)
+            rights[right] = not (value if value is not None else getattr(old_permissions, permission))
+
+        return raw.types.ChatBannedRights(until_date=until_date, **rights)
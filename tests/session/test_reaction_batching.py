@@ -0,0 +1,189 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+from pyrogram import Client, raw
+from pyrogram.errors import FloodWait, MessageIdInvalid
+from pyrogram.raw.core import MsgContainer
+from pyrogram.session import session as session_module
+from pyrogram.session import Session
+
+
+def updates():
+    return raw.types.Updates(updates=[], users=[], chats=[], date=0, seq=0)
+
+
+def send_reaction(msg_id: int):
+    return raw.functions.messages.SendReaction(peer=raw.types.InputPeerSelf(), msg_id=msg_id)
+
+
+class Connection:
+    """Answers every sent message with the values returned by reply(message, index)."""
+
+    def __init__(self, session: Session, reply):
+        self.session = session
+        self.reply = reply
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+        messages = message.body.messages if isinstance(message.body, MsgContainer) else [message]
+
+        for i, m in enumerate(messages):
+            value = self.reply(message, i, len(self.sent))
+
+            if value is not None:
+                target = message.msg_id if isinstance(value, raw.types.BadServerSalt) else m.msg_id
+                self.session.results[target].value = value
+                self.session.results[target].event.set()
+
+
+@pytest.fixture(autouse=True)
+def pack(monkeypatch):
+    # Skip the encryption, the fake connection receives the Message itself
+    monkeypatch.setattr(session_module.mtproto, "pack", lambda message, *args: message)
+
+
+def new_session(reply) -> Session:
+    session = Session(None, 2, bytes(256), False)
+    session.connection = Connection(session, reply)
+    session.is_started.set()
+
+    return session
+
+
+@pytest.mark.asyncio
+async def test_send_container_results():
+    def reply(_, i, __):
+        if i == 1:
+            return raw.types.RpcError(error_code=400, error_message="MESSAGE_ID_INVALID")
+
+        return updates()
+
+    session = new_session(reply)
+
+    results = await session.send_container([send_reaction(i) for i in range(3)])
+
+    assert len(session.connection.sent) == 1
+    assert isinstance(session.connection.sent[0].body, MsgContainer)
+    assert isinstance(results[0], raw.types.Updates)
+    assert isinstance(results[1], MessageIdInvalid)
+    assert isinstance(results[2], raw.types.Updates)
+    assert session.results == {}
+
+
+@pytest.mark.asyncio
+async def test_send_container_bad_server_salt():
+    def reply(container, i, attempt):
+        if attempt == 1:
+            if i == 0:
+                return raw.types.BadServerSalt(
+                    bad_msg_id=container.msg_id,
+                    bad_msg_seqno=container.seq_no,
+                    error_code=48,
+                    new_server_salt=42
+                )
+
+            return None
+
+        return updates()
+
+    session = new_session(reply)
+
+    results = await session.send_container([send_reaction(i) for i in range(2)])
+
+    assert session.salt == 42
+    assert len(session.connection.sent) == 2
+    assert all(isinstance(r, raw.types.Updates) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_send_container_isolates_unserializable_queries():
+    session = new_session(lambda *_: updates())
+
+    bad = raw.functions.messages.SendReaction(peer=raw.types.InputPeerSelf(), msg_id=1, reaction=[None])
+
+    results = await session.send_container([send_reaction(0), bad, send_reaction(2)])
+
+    assert len(session.connection.sent) == 1
+    assert [m.body.msg_id for m in session.connection.sent[0].body.messages] == [0, 2]
+    assert isinstance(results[0], raw.types.Updates)
+    assert isinstance(results[1], AttributeError)
+    assert isinstance(results[2], raw.types.Updates)
+    assert session.results == {}
+
+    results = await session.send_container([bad, bad])
+
+    assert len(session.connection.sent) == 1
+    assert all(isinstance(r, AttributeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_batch_falls_back_to_invoke():
+    client = Client("test", in_memory=True)
+    client.is_connected = True
+
+    class FakeSession:
+        async def send_container(self, queries):
+            return [FloodWait(value=1), OSError(), updates()]
+
+    invoked = []
+
+    async def invoke(query):
+        invoked.append(query.msg_id)
+        return updates()
+
+    async def fetch_peers(peers):
+        return False
+
+    client.session = FakeSession()
+    client.invoke = invoke
+    client.fetch_peers = fetch_peers
+
+    results = await asyncio.gather(*[client._invoke_batched_reaction(send_reaction(i)) for i in range(3)])
+
+    assert invoked == [0, 1]
+    assert all(isinstance(r, raw.types.Updates) for r in results)
+
+    client.reaction_batcher_task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await client.reaction_batcher_task
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batcher_fails_pending_reactions():
+    client = Client("test", in_memory=True)
+    client.is_connected = True
+
+    reaction = asyncio.ensure_future(client._invoke_batched_reaction(send_reaction(0)))
+
+    # Let the batcher take the reaction off the queue, then cancel it while it waits for more
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    client.reaction_batcher_task.cancel()
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(reaction, 1)
+
+    with pytest.raises(asyncio.CancelledError):
+        await client.reaction_batcher_task
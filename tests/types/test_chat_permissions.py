@@ -0,0 +1,168 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.types import ChatPermissions
+
+PERMISSIONS = (
+    "can_send_messages", "can_send_media_messages", "can_send_polls", "can_add_web_page_previews",
+    "can_change_info", "can_invite_users", "can_pin_messages", "can_manage_topics", "can_send_audios",
+    "can_send_docs", "can_send_games", "can_send_gifs", "can_send_inline", "can_send_photos",
+    "can_send_plain", "can_send_roundvideos", "can_send_stickers", "can_send_videos", "can_send_voices"
+)
+
+MEDIA_RIGHTS = (
+    "embed_links", "send_audios", "send_docs", "send_games", "send_gifs", "send_inline",
+    "send_photos", "send_polls", "send_roundvideos", "send_stickers", "send_videos", "send_voices"
+)
+
+
+def old_banned_rights(permissions: ChatPermissions, old_permissions: ChatPermissions) -> raw.types.ChatBannedRights:
+    """The ChatBannedRights that set_chat_permissions built inline before ChatPermissions.write() existed."""
+    if permissions.all_perms is not None:
+        rights = dict.fromkeys(
+            ("send_messages", "send_media", "send_polls", "embed_links", "change_info",
+             "invite_users", "pin_messages", "manage_topics", "send_inline"),
+            not permissions.all_perms
+        )
+
+        return raw.types.ChatBannedRights(until_date=0, **rights)
+
+    rights = {}
+
+    for permission in PERMISSIONS[2:]:
+        value = getattr(permissions, permission)
+        right = "embed_links" if permission == "can_add_web_page_previews" else permission[4:]
+        rights[right] = not (value if value is not None else getattr(old_permissions, permission))
+
+    can_send_media_messages = permissions.can_send_media_messages
+
+    if permissions.can_send_messages is not None:
+        rights["send_plain"] = not permissions.can_send_messages
+
+        if can_send_media_messages is None:
+            can_send_media_messages = old_permissions.can_send_media_messages
+
+    if can_send_media_messages is not None:
+        rights.update(dict.fromkeys(MEDIA_RIGHTS, not can_send_media_messages))
+
+    return raw.types.ChatBannedRights(until_date=0, **rights)
+
+
+def random_permissions(rng: random.Random) -> ChatPermissions:
+    return ChatPermissions(**{permission: rng.choice((None, True, False)) for permission in PERMISSIONS})
+
+
+def random_old_permissions(rng: random.Random) -> ChatPermissions:
+    return ChatPermissions(**{permission: rng.choice((True, False)) for permission in PERMISSIONS})
+
+
+@pytest.mark.parametrize("all_perms", [True, False])
+def test_write_all_perms(all_perms):
+    expected = raw.types.ChatBannedRights(
+        until_date=0,
+        send_messages=not all_perms,
+        send_media=not all_perms,
+        send_polls=not all_perms,
+        embed_links=not all_perms,
+        change_info=not all_perms,
+        invite_users=not all_perms,
+        pin_messages=not all_perms,
+        manage_topics=not all_perms,
+        send_inline=not all_perms
+    )
+
+    permissions = ChatPermissions(all_perms=all_perms, can_send_polls=all_perms)
+
+    assert not permissions._needs_old_permissions
+    assert permissions.write() == expected
+    assert permissions.write(until_date=42).until_date == 42
+
+
+def test_write_empty_permissions_deny_all():
+    assert ChatPermissions().write() == ChatPermissions(all_perms=False).write()
+
+
+@pytest.mark.parametrize("can_send_media_messages", [True, False])
+def test_write_media_override(can_send_media_messages):
+    old_permissions = ChatPermissions(**dict.fromkeys(PERMISSIONS, can_send_media_messages))
+    permissions = ChatPermissions(
+        can_send_messages=True,
+        can_send_media_messages=can_send_media_messages,
+        can_send_polls=not can_send_media_messages,
+        can_change_info=True
+    )
+
+    rights = permissions.write(old_permissions)
+
+    assert rights == old_banned_rights(permissions, old_permissions)
+    assert rights.send_plain is False
+    assert rights.send_polls is not can_send_media_messages
+    assert rights.change_info is False
+    assert rights.invite_users is not can_send_media_messages
+
+
+def test_write_messages_override_reads_old_media():
+    old_permissions = ChatPermissions(**dict.fromkeys(PERMISSIONS, True))
+    permissions = ChatPermissions(can_send_messages=False)
+
+    assert permissions._needs_old_permissions
+
+    rights = permissions.write(old_permissions)
+
+    assert rights == old_banned_rights(permissions, old_permissions)
+    assert rights.send_plain is True
+    assert not any(getattr(rights, right) for right in MEDIA_RIGHTS)
+
+
+def test_write_falls_back_to_old_permissions():
+    rng = random.Random(0)
+
+    for _ in range(5000):
+        permissions = random_permissions(rng)
+        old_permissions = random_old_permissions(rng)
+
+        assert permissions.write(old_permissions) == old_banned_rights(permissions, old_permissions)
+
+
+def test_needs_old_permissions():
+    rng = random.Random(1)
+    outcomes = set()
+
+    for _ in range(5000):
+        permissions = random_permissions(rng)
+
+        # Fill a random subset with bools, so that fully specified permissions come up as well
+        for permission in rng.sample(PERMISSIONS, rng.randrange(len(PERMISSIONS))):
+            setattr(permissions, permission, rng.choice((True, False)))
+
+        try:
+            permissions.write()
+        except AttributeError:
+            written = False
+        else:
+            written = True
+
+        assert permissions._needs_old_permissions is not written
+        outcomes.add(written)
+
+    assert outcomes == {True, False}